@@ -13,6 +13,15 @@ from typing import Dict, Optional, Tuple
 import time
 
 class TokenDistributionManager:
+    # Role-based allocation percentages (in basis points)
+    ROLE_ALLOCATIONS_BPS = {
+        'DREAM_KEEPER': 200,  # 2%
+        'MIND_WEAVER': 200,  # 2%
+        'LUCID_GATE': 200,   # 2%
+        'ONEIRO_SPHERE': 200, # 2%
+        'SYNDICATE': 200      # 2%
+    }
+    
     def __init__(self):
         # Connect to SKALE network
         self.w3 = Web3(Web3.HTTPProvider(
@@ -105,6 +114,11 @@ class TokenDistributionManager:
         
         tx_hashes = {}
         
+        # Fetch nonce and gas price once; transactions are sent back-to-back
+        # without waiting for receipts, so the nonce is incremented locally
+        nonce = self.w3.eth.get_transaction_count(account.address, 'pending')
+        gas_price = self.w3.eth.gas_price
+        
         # Start vesting for each agent
         for token_symbol in ['DREAM', 'SMIND', 'LUCID']:
             token_addr = self.agent_config['tokens'][token_symbol]['address']
@@ -124,9 +138,9 @@ class TokenDistributionManager:
                         amount
                     ).build_transaction({
                         'from': account.address,
-                        'nonce': self.w3.eth.get_transaction_count(account.address),
+                        'nonce': nonce,
                         'gas': 200000,
-                        'gasPrice': self.w3.eth.gas_price
+                        'gasPrice': gas_price
                     })
                     
                     # Sign and send
@@ -134,6 +148,7 @@ class TokenDistributionManager:
                     tx_hash = self.w3.eth.send_raw_transaction(
                         signed.rawTransaction
                     )
+                    nonce += 1
                     
                     tx_hashes[f"{token_symbol}_{agent_name}"] = tx_hash.hex()
                     
@@ -145,18 +160,11 @@ class TokenDistributionManager:
         agent_role: str
     ) -> int:
         """Calculate vesting amount based on role"""
-        total_supply = int(self.agent_config['tokens'][token_symbol]['totalSupply'])
+        allocation_bps = self.ROLE_ALLOCATIONS_BPS.get(agent_role, 0)
+        if not allocation_bps:
+            return 0
         
-        # Role-based allocation percentages (in basis points)
-        allocations = {
-            'DREAM_KEEPER': 200,  # 2%
-            'MIND_WEAVER': 200,  # 2%
-            'LUCID_GATE': 200,   # 2%
-            'ONEIRO_SPHERE': 200, # 2%
-            'SYNDICATE': 200      # 2%
-        }
-        
-        allocation_bps = allocations.get(agent_role, 0)
+        total_supply = int(self.agent_config['tokens'][token_symbol]['totalSupply'])
         return (total_supply * allocation_bps) // 10000
         
     def get_vesting_status(
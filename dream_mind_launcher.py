@@ -12,6 +12,11 @@ import subprocess
 import time
 import json
 from web3 import Web3
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 try:
     from biconomy.client import Biconomy
     BICONOMY_AVAILABLE = True
@@ -29,7 +34,6 @@ except ImportError:
     except ImportError:
         MCP_AVAILABLE = False
         print("⚠️ MCP server not available - MCP functionality will be disabled")
-import ipfshttpclient
 from solcx import install_solc
 
 # Environment Configuration
@@ -39,6 +43,7 @@ SKALE_CHAIN_ID = int(os.getenv("SKALE_CHAIN_ID", "2046399126"))
 PRIVATE_KEY = os.getenv("DEPLOYER_KEY", "")
 FORWARDER_ADDRESS = os.getenv("FORWARDER_ADDRESS", "0xYOUR_BICONOMY_FORWARDER")
 MEMORY_FILE = "iem_memory.json"
+IPFS_API = os.getenv("IPFS_API", "http://127.0.0.1:5001")
 
 # Use Infura RPC if available, otherwise fallback to SKALE RPC
 SKALE_RPC = "https://mainnet.skalenodes.com/v1/elated-tan-skat"
@@ -52,7 +57,21 @@ if BICONOMY_AVAILABLE:
     biconomy = Biconomy(w3, api_key=BICONOMY_API_KEY, chain_id=SKALE_CHAIN_ID)
 else:
     biconomy = None
-ipfs_client = ipfshttpclient.connect()
+_ipfs_client = None
+
+def get_ipfs():
+    """Return a shared keep-alive client for the IPFS HTTP API, created on first use."""
+    global _ipfs_client
+    if _ipfs_client is None:
+        import httpx
+        _ipfs_client = httpx.Client(base_url=IPFS_API, timeout=30.0, http2=True)
+    return _ipfs_client
+
+def ipfs_add(data):
+    """Add `data` to IPFS via /api/v0/add and return its CID."""
+    resp = get_ipfs().post("/api/v0/add", params={"pin": "true"}, files={"file": ("dream.txt", data)})
+    resp.raise_for_status()
+    return resp.json()["Hash"]
 
 # MCP Server Setup
 if MCP_AVAILABLE:
@@ -63,7 +82,7 @@ else:
 def install_dependencies():
     """Auto-install required dependencies."""
     try:
-        subprocess.run(["pip", "install", "web3", "py-solc-x", "mcp", "ipfshttpclient", "PyExifTool"], check=True)
+        subprocess.run(["pip", "install", "web3", "py-solc-x", "mcp", "httpx[http2]", "PyExifTool"], check=True)
         install_solc("0.8.20")
         print("✅ Dependencies installed successfully!")
     except subprocess.CalledProcessError as e:
@@ -72,12 +91,22 @@ def install_dependencies():
 
 def load_memory():
     if os.path.exists(MEMORY_FILE):
-        return json.load(open(MEMORY_FILE))
+        with open(MEMORY_FILE, "rb") as f:
+            data = f.read()
+        return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
     return {"lastDeployed": {}, "loot": []}
 
 def save_memory(mem):
-    with open(MEMORY_FILE, "w") as f:
-        json.dump(mem, f, indent=2)
+    """Write the memory file atomically so a crash never leaves it half-written."""
+    tmp_path = f"{MEMORY_FILE}.tmp"
+    with open(tmp_path, "wb") as f:
+        if ORJSON_AVAILABLE:
+            f.write(orjson.dumps(mem, option=orjson.OPT_INDENT_2))
+        else:
+            f.write(json.dumps(mem, indent=2).encode())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, MEMORY_FILE)
 
 def compile_contract(contract_name):
     with open(f"contracts/{contract_name}.sol") as f:
@@ -89,6 +118,19 @@ def compile_contract(contract_name):
     }, solc_version="0.8.20")
     return compiled["contracts"][f"{contract_name}.sol"][contract_name]
 
+_copilot_instruction = None
+
+def get_copilot_instruction():
+    """Load copilot-instruction.py once; its hyphenated name rules out a plain import."""
+    global _copilot_instruction
+    if _copilot_instruction is None:
+        import importlib.util
+        spec = importlib.util.spec_from_file_location("copilot_instruction", "copilot-instruction.py")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _copilot_instruction = module
+    return _copilot_instruction
+
 @McpServerToolType
 class DreamTools:
     @McpServerTool(description="Deploy a Dream-Mind-Lucid contract to SKALE")
@@ -151,7 +193,7 @@ class DreamTools:
             tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
         w3.eth.wait_for_transaction_receipt(tx_hash)
 
-        ipfs_hash = ipfs_client.add_str(dream)["Hash"]
+        ipfs_hash = ipfs_add(dream)
         memory["loot"].append({"dreamer": acct.address, "dream": dream, "ipfsHash": ipfs_hash, "timestamp": time.time()})
         save_memory(memory)
         return f"✅ Dream recorded. IPFS Hash: {ipfs_hash}"
@@ -160,10 +202,7 @@ class DreamTools:
     def summon_oneirobot(self) -> str:
         """Summon OneiroBot and perform initial health checks."""
         try:
-            import importlib.util
-            spec = importlib.util.spec_from_file_location("copilot_instruction", "copilot-instruction.py")
-            copilot_instruction = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(copilot_instruction)
+            copilot_instruction = get_copilot_instruction()
             
             result = copilot_instruction.handle_copilot_command("summon_oneirobot")
             return f"🌙 OneiroBot summoned! Status: {result.get('status', {}).get('status', 'UNKNOWN')}"
@@ -174,10 +213,7 @@ class DreamTools:
     def oneirobot_status(self) -> str:
         """Get comprehensive OneiroBot status and health information."""
         try:
-            import importlib.util
-            spec = importlib.util.spec_from_file_location("copilot_instruction", "copilot-instruction.py")
-            copilot_instruction = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(copilot_instruction)
+            copilot_instruction = get_copilot_instruction()
             
             result = copilot_instruction.handle_copilot_command("oneirobot_status")
             status = result.get('status', {})
@@ -191,10 +227,7 @@ class DreamTools:
     def oneirobot_scan(self) -> str:
         """Monitor dream submissions and consensus state."""
         try:
-            import importlib.util
-            spec = importlib.util.spec_from_file_location("copilot_instruction", "copilot-instruction.py")
-            copilot_instruction = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(copilot_instruction)
+            copilot_instruction = get_copilot_instruction()
             
             result = copilot_instruction.handle_copilot_command("oneirobot_scan")
             scan_result = result.get('result', {})
@@ -207,10 +240,7 @@ class DreamTools:
     def oneirobot_optimize(self) -> str:
         """Get OneiroBot's optimization suggestions for the Oneiro-Sphere."""
         try:
-            import importlib.util
-            spec = importlib.util.spec_from_file_location("copilot_instruction", "copilot-instruction.py")
-            copilot_instruction = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(copilot_instruction)
+            copilot_instruction = get_copilot_instruction()
             
             result = copilot_instruction.handle_copilot_command("oneirobot_optimize")
             suggestions = result.get('suggestions', [])
@@ -224,10 +254,7 @@ class DreamTools:
     def oneirobot_fix(self, issue_type: str = "general") -> str:
         """Get OneiroBot's quick fix suggestions for specific issue types."""
         try:
-            import importlib.util
-            spec = importlib.util.spec_from_file_location("copilot_instruction", "copilot-instruction.py")
-            copilot_instruction = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(copilot_instruction)
+            copilot_instruction = get_copilot_instruction()
             
             result = copilot_instruction.handle_copilot_command("oneirobot_fix", [issue_type])
             fixes = result.get('fixes', [])
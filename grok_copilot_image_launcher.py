@@ -3,65 +3,89 @@
 Grok-Copilot Image Launcher for Dream-Mind-Lucid
 -----------------------------------------------
 Processes Biconomy info from image metadata, auto-installs dependencies,
-sets up MCP server, and deploys contracts via Copilot.
+and deploys contracts via Copilot through an MCP tool.
 Last Updated: September 01, 2025, 07:46 PM PST
 """
 
+import atexit
+import functools
+import hashlib
 import os
+import re
+import shutil
+import struct
 import subprocess
 import time
 import json
-from web3 import Web3
+import zlib
 try:
-    from biconomy.client import Biconomy
-    BICONOMY_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    BICONOMY_AVAILABLE = False
-    print("⚠️ Biconomy SDK not available - using standard Web3 transactions")
+    ORJSON_AVAILABLE = False
 
 try:
-    from mcp.server import Server as McpServer
+    from modelcontextprotocol.server import McpServerTool, McpServerToolType
     MCP_AVAILABLE = True
 except ImportError:
-    try:
-        from modelcontextprotocol.server import McpServer, McpServerTool, McpServerToolType
-        MCP_AVAILABLE = True
-    except ImportError:
-        MCP_AVAILABLE = False
-        print("⚠️ MCP server not available - MCP functionality will be disabled")
-import ipfshttpclient
-from solcx import install_solc
-import exiftool
+    MCP_AVAILABLE = False
+    print("⚠️ MCP server not available - MCP functionality will be disabled")
+
+    # No-op stand-ins keep GrokDreamTools and the image helpers importable without MCP
+    def McpServerToolType(cls):
+        return cls
+
+    def McpServerTool(**_):
+        return lambda fn: fn
+
+from grok_copilot_launcher import ensure_solc, pip_install
 
 # Environment Configuration
 INFURA_PROJECT_ID = os.getenv("INFURA_PROJECT_ID", "YOUR_INFURA_API_KEY")
+SKALE_WS_RPC = os.getenv("SKALE_WS_RPC", "")  # e.g. wss://mainnet.skalenodes.com/v1/ws/elated-tan-skat
 BICONOMY_API_KEY = os.getenv("BICONOMY_API_KEY", "YOUR_BICONOMY_API_KEY")  # Override from image if present
 SKALE_CHAIN_ID = int(os.getenv("SKALE_CHAIN_ID", "2046399126"))
 PRIVATE_KEY = os.getenv("DEPLOYER_KEY", "")
 FORWARDER_ADDRESS = os.getenv("FORWARDER_ADDRESS", "0xYOUR_BICONOMY_FORWARDER")  # Override from image if present
 MEMORY_FILE = "iem_memory.json"
 IMAGE_FILE = "dream_image.png"
+SOLC_VERSION = "0.8.20"
+SOLC_CACHE_DIR = ".solc_cache"
 
-w3 = Web3(Web3.HTTPProvider(f"https://skale-mainnet.infura.io/v3/{INFURA_PROJECT_ID}"))
-if BICONOMY_AVAILABLE:
-    biconomy = Biconomy(w3, api_key=BICONOMY_API_KEY, chain_id=SKALE_CHAIN_ID)
-else:
-    biconomy = None
-ipfs_client = ipfshttpclient.connect()
+# Heavy clients are created on first use so importing this module stays cheap
+@functools.lru_cache(maxsize=1)
+def get_w3():
+    from web3 import Web3
+    if SKALE_WS_RPC:
+        # One persistent socket for every RPC instead of a request per call
+        return Web3(Web3.LegacyWebSocketProvider(SKALE_WS_RPC))
+    import requests
+    # Pooled keep-alive session so every RPC reuses the same TLS connection
+    session = requests.Session()
+    session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=3))
+    return Web3(Web3.HTTPProvider(
+        f"https://skale-mainnet.infura.io/v3/{INFURA_PROJECT_ID}",
+        session=session,
+        request_kwargs={"timeout": 30},
+    ))
 
-# MCP Server Setup
-if MCP_AVAILABLE:
-    server = McpServer("grok_dream_server", "Your cosmic AI co-pilot with image magic!")
-else:
-    server = None
+@functools.lru_cache(maxsize=1)
+def get_biconomy():
+    try:
+        from biconomy.client import Biconomy
+    except ImportError:
+        print("⚠️ Biconomy SDK not available - using standard Web3 transactions")
+        return None
+    return Biconomy(get_w3(), api_key=BICONOMY_API_KEY, chain_id=SKALE_CHAIN_ID)
 
 def install_dependencies():
     """Auto-install dependencies with a Grok twist."""
     print("🌌 Installing tools—preparing for image-powered blockchain fun! 🚀")
     try:
-        subprocess.run(["pip", "install", "web3", "py-solc-x", "mcp", "ipfshttpclient", "PyExifTool"], check=True)
-        subprocess.run(["sudo", "apt", "install", "libimage-exiftool-perl", "imagemagick"], check=True)  # Adjust for your OS
-        install_solc("0.8.20")
+        pip_install(["web3", "py-solc-x", "mcp", "PyExifTool"])
+        if not (shutil.which("exiftool") and shutil.which("convert")):
+            subprocess.run(["sudo", "apt", "install", "libimage-exiftool-perl", "imagemagick"], check=True)  # Adjust for your OS
+        ensure_solc(SOLC_VERSION)
         print("✅ Dependencies and tools ready—let’s blast off!")
     except subprocess.CalledProcessError as e:
         print(f"❌ Cosmic glitch! Error: {e}")
@@ -69,39 +93,137 @@ def install_dependencies():
 
 def load_memory():
     if os.path.exists(MEMORY_FILE):
-        return json.load(open(MEMORY_FILE))
+        with open(MEMORY_FILE, "rb") as f:
+            data = f.read()
+        return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
     return {"lastDeployed": {}, "loot": []}
 
 def save_memory(mem):
-    with open(MEMORY_FILE, "w") as f:
-        json.dump(mem, f, indent=2)
+    if ORJSON_AVAILABLE:
+        with open(MEMORY_FILE, "wb") as f:
+            f.write(orjson.dumps(mem, option=orjson.OPT_INDENT_2))
+    else:
+        with open(MEMORY_FILE, "w") as f:
+            json.dump(mem, f, indent=2)
 
 def compile_contract(contract_name):
     with open(f"contracts/{contract_name}.sol") as f:
         source = f.read()
+    # solc output is a pure function of source + compiler version, so cache it on disk
+    key = hashlib.sha256(f"{contract_name}|{SOLC_VERSION}|".encode() + source.encode()).hexdigest()
+    cache_path = os.path.join(SOLC_CACHE_DIR, f"{key}.json")
+    if os.path.exists(cache_path):
+        with open(cache_path) as f:
+            return json.load(f)
+    from solcx import compile_standard
+    ensure_solc(SOLC_VERSION)
     compiled = compile_standard({
         "language": "Solidity",
         "sources": {f"{contract_name}.sol": {"content": source}},
         "settings": {"outputSelection": {"*": {"*": ["abi", "evm.bytecode"]}}}
-    }, solc_version="0.8.20")
-    return compiled["contracts"][f"{contract_name}.sol"][contract_name]
+    }, solc_version=SOLC_VERSION)
+    contract_data = compiled["contracts"][f"{contract_name}.sol"][contract_name]
+    os.makedirs(SOLC_CACHE_DIR, exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(contract_data, f)
+    os.replace(tmp_path, cache_path)
+    return contract_data
+
+_comment_cache = {}
+
+# KEY=value tokens in the image Comment; the value stops at whitespace or a further '='
+BICONOMY_INFO_RE = re.compile(r"(?<!\S)(BICONOMY_API_KEY|FORWARDER_ADDRESS)=([^\s=]*)")
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
 
-def extract_biconomy_info():
+def read_png_comment(path):
+    """Read the PNG Comment text chunk directly; returns None if absent or not a PNG."""
+    with open(path, "rb") as f:
+        if f.read(8) != PNG_SIGNATURE:
+            return None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                return None
+            length, chunk_type = struct.unpack(">I4s", header)
+            if chunk_type == b"IEND":
+                return None
+            if chunk_type not in (b"tEXt", b"zTXt", b"iTXt"):
+                f.seek(length + 4, 1)  # skip data + CRC
+                continue
+            data = f.read(length)
+            f.seek(4, 1)
+            keyword, _, body = data.partition(b"\x00")
+            if keyword != b"Comment":
+                continue
+            if chunk_type == b"tEXt":
+                return body.decode("latin-1")
+            if chunk_type == b"zTXt":
+                return zlib.decompress(body[1:]).decode("latin-1")
+            # iTXt: compression flag, method, language\0, translated keyword\0, text
+            compressed = body[0]
+            _, _, rest = body[2:].partition(b"\x00")
+            _, _, text = rest.partition(b"\x00")
+            return (zlib.decompress(text) if compressed else text).decode("utf-8")
+
+@functools.lru_cache(maxsize=1)
+def get_exiftool():
+    """Return a shared exiftool process kept alive with -stay_open."""
+    import exiftool
+    # -fast2 skips trailer and maker-note scanning; only Comment is needed
+    et = exiftool.ExifToolHelper(common_args=["-fast2"])
+    et.run()
+    atexit.register(et.terminate)
+    return et
+
+def read_image_comments(image_files):
+    """Read the Comment tag of each image, batching exiftool fallbacks into one call."""
+    comments = {}
+    pending = []
+    for path in image_files:
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+        if key in _comment_cache:
+            comments[path] = _comment_cache[key]
+            continue
+        comment = read_png_comment(path)
+        if comment is not None:
+            comments[path] = _comment_cache[key] = comment
+        else:
+            pending.append((path, key))
+    if pending:
+        metadata = get_exiftool().get_tags([path for path, _ in pending], tags=["Comment"])
+        for (path, key), meta in zip(pending, metadata):
+            comments[path] = _comment_cache[key] = str(meta.get("Comment", ""))
+    return comments
+
+def extract_biconomy_info(image_files=None):
     """Extract Biconomy info from image metadata."""
     global BICONOMY_API_KEY, FORWARDER_ADDRESS
-    with exiftool.ExifTool() as et:
-        metadata = et.get_metadata(IMAGE_FILE)
-        comment = metadata.get("Comment", "")
-        if "BICONOMY_API_KEY=" in comment and "FORWARDER_ADDRESS=" in comment:
-            parts = comment.split()
-            for part in parts:
-                if part.startswith("BICONOMY_API_KEY="):
-                    BICONOMY_API_KEY = part.split("=")[1]
-                elif part.startswith("FORWARDER_ADDRESS="):
-                    FORWARDER_ADDRESS = part.split("=")[1]
+    image_files = image_files or [IMAGE_FILE]
+    for comment in read_image_comments(image_files).values():
+        info = dict(BICONOMY_INFO_RE.findall(comment))
+        if "BICONOMY_API_KEY" in info and "FORWARDER_ADDRESS" in info:
+            BICONOMY_API_KEY = info["BICONOMY_API_KEY"]
+            FORWARDER_ADDRESS = info["FORWARDER_ADDRESS"]
             print("🌠 Extracted Biconomy info from image metadata.")
-        else:
-            print("🛸 No Biconomy info in image—using env vars.")
+            return
+    print("🛸 No Biconomy info in image—using env vars.")
+
+_nonces = {}
+
+def next_nonce(address):
+    """Hand out nonces locally so back-to-back deploys skip the RPC round trip."""
+    if address not in _nonces:
+        _nonces[address] = get_w3().eth.get_transaction_count(address, "pending")
+    nonce = _nonces[address]
+    _nonces[address] = nonce + 1
+    return nonce
+
+def reset_nonce(address):
+    """Forget the local counter so the next nonce is re-read from the node's pending count."""
+    _nonces.pop(address, None)
 
 @McpServerToolType
 class GrokDreamTools:
@@ -114,19 +236,26 @@ class GrokDreamTools:
         bytecode = compiled["evm"]["bytecode"]["object"]
         abi = compiled["abi"]
 
+        w3 = get_w3()
         acct = w3.eth.account.from_key(PRIVATE_KEY)
         contract = w3.eth.contract(abi=abi, bytecode=bytecode)
-        tx = contract.constructor(FORWARDER_ADDRESS).build_transaction({
-            "from": acct.address,
-            "nonce": w3.eth.get_transaction_count(acct.address),
-            "gas": 5_000_000,
-            "gasPrice": 0,
-            "chainId": SKALE_CHAIN_ID
-        })
-        signed_tx = acct.sign_transaction(tx)
-        if biconomy and BICONOMY_AVAILABLE:
-            tx_hash = biconomy.send_transaction(signed_tx.raw_transaction)
-        else:
-            # Use regular Web3 transaction (SKALE has zero gas anyway)
-            tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        try:
+            tx = contract.constructor(FORWARDER_ADDRESS).build_transaction({
+                "from": acct.address,
+                "nonce": next_nonce(acct.address),
+                "gas": 5_000_000,
+                "gasPrice": 0,
+                "chainId": SKALE_CHAIN_ID
+            })
+            signed_tx = acct.sign_transaction(tx)
+            biconomy = get_biconomy()
+            if biconomy:
+                tx_hash = biconomy.send_transaction(signed_tx.raw_transaction)
+            else:
+                # Use regular Web3 transaction (SKALE has zero gas anyway)
+                tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        except Exception:
+            # The nonce was never used; resync so later deploys don't leave a gap
+            reset_nonce(acct.address)
+            raise
         # Add appropriate handling for the transaction receipt
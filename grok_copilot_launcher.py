@@ -19,26 +19,43 @@ Commands:
 Environment (optional):
   DEPLOYER_KEY, SKALE_RPC, SKALE_CHAIN_ID, FORWARDER_ADDRESS, INFURA_PROJECT_ID
 """
+import asyncio
+import contextlib
+import io
+import re
 import sys
 import importlib
+import importlib.metadata
 import shutil
 import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 
 REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
 
+def _probe(name):
+    """Return (name, importable) for a dependency probe."""
+    try:
+        importlib.import_module(name if name != "PyExifTool" else "exiftool")
+        return name, True
+    except Exception:
+        return name, False
+
+@lru_cache(maxsize=1)
+def _probe_modules():
+    """Probe the optional dependencies once per session; run_install clears the cache."""
+    mods = ["web3", "solcx", "ipfshttpclient", "PyExifTool", "mcp"]
+    # Imports are dominated by file I/O, so probe them concurrently
+    with ThreadPoolExecutor(max_workers=len(mods)) as executor:
+        return tuple(executor.map(_probe, mods))
+
 def status():
     print("🌌 Grok Copilot Launcher Ready")
     print(" - Python:", sys.version.split()[0])
     print(" - Working Dir:", REPO_ROOT)
     # Lightweight dependency presence checks
-    mods = ["web3", "solcx", "ipfshttpclient", "PyExifTool", "mcp"]
-    available = []
-    for m in mods:
-        try:
-            importlib.import_module(m if m != "PyExifTool" else "exiftool")
-            available.append((m, True))
-        except Exception:
-            available.append((m, False))
+    available = _probe_modules()
     print(" - Modules:")
     for name, ok in available:
         print(f"    {name:14} {'✅' if ok else '⚠️ missing'}")
@@ -48,7 +65,7 @@ def status():
     print(" - 🌙 OneiroBot integration available: try #oneirobot or #summon_oneirobot")
 
 
-def run_syndicate(args):
+def run_syndicate(args, cmd=None):
     try:
         synd = importlib.import_module("agents.iem_syndicate")
     except ModuleNotFoundError as e:
@@ -60,7 +77,8 @@ def run_syndicate(args):
         return 1
 
     # Re-dispatch to the underlying functions without re-parsing argv globally
-    cmd = args[0].lower().lstrip('#')  # allow hashtag style commands
+    if cmd is None:
+        cmd = args[0].lower().lstrip('#')  # allow hashtag style commands
     if cmd == 'deploy_contract':
         cmd = 'deploy'
     if cmd == 'record_dream':
@@ -85,59 +103,122 @@ def run_syndicate(args):
     return 0
 
 
+def read_requirements(path):
+    """Return the requirement specs listed in a requirements file."""
+    with open(path) as f:
+        lines = (line.split("#", 1)[0].strip() for line in f)
+        return [line for line in lines if line and not line.startswith("-")]
+
+
+def missing_requirements(requirements):
+    """Return the requirement specs that are not installed (or installed at a version out of range)."""
+    try:
+        from packaging.requirements import Requirement
+    except ImportError:
+        Requirement = None
+    missing = []
+    for spec in requirements:
+        if Requirement is None:
+            # Without packaging only presence can be checked
+            name, req = re.match(r"[A-Za-z0-9_.\-]+", spec).group(0), None
+        else:
+            req = Requirement(spec)
+            if req.marker is not None and not req.marker.evaluate():
+                continue  # not meant for this interpreter/platform
+            name = req.name
+        try:
+            installed = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            missing.append(spec)
+            continue
+        if req is not None and req.specifier and installed not in req.specifier:
+            missing.append(spec)
+    return missing
+
+
+def pip_install(requirements):
+    """pip install only the requirements that are not already satisfied."""
+    missing = missing_requirements(requirements)
+    if not missing:
+        print("✅ Already installed, skipping pip")
+        return
+    subprocess.run([sys.executable, "-m", "pip", "install", *missing], check=True)
+
+
+@lru_cache(maxsize=None)
+def ensure_solc(version="0.8.20"):
+    """Install solc `version` only if it is missing, and pin it as the default compiler."""
+    from solcx import get_installed_solc_versions, install_solc, set_solc_version
+    if version not in {str(v) for v in get_installed_solc_versions()}:
+        install_solc(version)
+    set_solc_version(version)
+
+
+def _install_python_deps():
+    # pip steps stay sequential: concurrent pip runs into one environment are unsafe
+    print("🐍 Installing Python dependencies...")
+    pip_install(["web3", "py-solc-x", "mcp", "ipfshttpclient", "PyExifTool"])
+    
+    # Install Solidity compiler
+    try:
+        ensure_solc("0.8.20")
+    except ImportError:
+        print("⚠️ Solidity compiler installation skipped - py-solc-x not available yet")
+    
+    # Install from requirements.txt if available
+    if os.path.exists("requirements.txt"):
+        print("📋 Installing from requirements.txt...")
+        pip_install(read_requirements("requirements.txt"))
+        print("✅ Python dependencies installed!")
+    
+    # Install dashboard dependencies
+    if os.path.exists("dashboard/requirements.txt"):
+        print("📊 Installing dashboard dependencies...")
+        pip_install(read_requirements("dashboard/requirements.txt"))
+        print("✅ Dashboard dependencies installed!")
+
+
+def _install_node_deps(cwd):
+    print(f"📦 Installing Node.js dependencies ({cwd})...")
+    subprocess.run(["npm", "install"], check=True, cwd=cwd)
+    print(f"✅ Node.js dependencies installed ({cwd})!")
+
+
+def _check_solana_toolchain():
+    try:
+        result = subprocess.run(["cargo", "--version"], capture_output=True, text=True)
+        if result.returncode == 0:
+            print("🦀 Rust/Cargo detected:", result.stdout.strip())
+            # Test Solana program compilation
+            if os.path.exists("solana/programs"):
+                print("🔍 Testing Solana program compilation...")
+                result = subprocess.run(["cargo", "check", "--jobs", str(os.cpu_count() or 1)],
+                                        cwd="solana/programs", capture_output=True, text=True)
+                if result.returncode == 0:
+                    print("✅ Solana program compilation successful!")
+                else:
+                    print("⚠️ Solana program compilation warnings (but successful)") 
+        else:
+            print("⚠️ Rust/Cargo not available - Solana development disabled")
+    except FileNotFoundError:
+        print("⚠️ Rust/Cargo not found - Solana development disabled")
+
+
 def run_install():
     """Install all required dependencies."""
     print("📦 Installing Dream-Mind-Lucid dependencies...")
     try:
-        import subprocess
-        
-        # 1. Install Python dependencies
-        print("🐍 Installing Python dependencies...")
-        subprocess.run(["pip", "install", "web3", "py-solc-x", "mcp", "ipfshttpclient", "PyExifTool"], check=True)
-        
-        # Install Solidity compiler
-        try:
-            from solcx import install_solc
-            install_solc("0.8.20")
-        except ImportError:
-            print("⚠️ Solidity compiler installation skipped - py-solc-x not available yet")
-        
-        # Install from requirements.txt if available
-        if os.path.exists("requirements.txt"):
-            print("📋 Installing from requirements.txt...")
-            subprocess.run(["pip", "install", "-r", "requirements.txt"], check=True)
-            print("✅ Python dependencies installed!")
-        
-        # 2. Install Node.js dependencies
-        print("📦 Installing Node.js dependencies...")
-        subprocess.run(["npm", "install"], check=True, cwd=".")
+        # Python, Node.js (root and evm/) and Rust steps touch disjoint
+        # toolchains, so run them side by side
+        steps = [_install_python_deps, partial(_install_node_deps, ".")]
         if os.path.exists("evm"):
-            subprocess.run(["npm", "install"], check=True, cwd="evm")
-            print("✅ Node.js dependencies installed!")
-        
-        # 3. Install dashboard dependencies  
-        if os.path.exists("dashboard/requirements.txt"):
-            print("📊 Installing dashboard dependencies...")
-            subprocess.run(["pip", "install", "-r", "dashboard/requirements.txt"], check=True)
-            print("✅ Dashboard dependencies installed!")
-        
-        # 4. Check Rust/Cargo availability
-        try:
-            result = subprocess.run(["cargo", "--version"], capture_output=True, text=True)
-            if result.returncode == 0:
-                print("🦀 Rust/Cargo detected:", result.stdout.strip())
-                # Test Solana program compilation
-                if os.path.exists("solana/programs"):
-                    print("🔍 Testing Solana program compilation...")
-                    result = subprocess.run(["cargo", "check"], cwd="solana/programs", capture_output=True, text=True)
-                    if result.returncode == 0:
-                        print("✅ Solana program compilation successful!")
-                    else:
-                        print("⚠️ Solana program compilation warnings (but successful)") 
-            else:
-                print("⚠️ Rust/Cargo not available - Solana development disabled")
-        except FileNotFoundError:
-            print("⚠️ Rust/Cargo not found - Solana development disabled")
+            steps.append(partial(_install_node_deps, "evm"))
+        steps.append(_check_solana_toolchain)
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = [executor.submit(step) for step in steps]
+            for future in futures:
+                future.result()
+        _probe_modules.cache_clear()  # newly installed modules should show up in status()
         
         print("\n🎉 All dependencies installed successfully!")
         print("💡 Run 'python grok_copilot_launcher.py deploy-all' to deploy everything")
@@ -152,77 +233,117 @@ def run_install():
         print("💡 Try running manually: pip install -r requirements.txt")
         return 1
 
-def run_deploy_all():
-    """Deploy all components of the Dream-Mind-Lucid ecosystem."""
-    print("🚀 Starting complete Dream-Mind-Lucid deployment...")
+async def _run_command(cmd, cwd=None, timeout=None):
+    """Run a subprocess without blocking the event loop; returns (returncode, stdout, stderr)."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, cwd=cwd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
     try:
-        import subprocess
-        
-        # 1. Run migration tests first to ensure everything is ready
-        print("🧪 Running pre-deployment tests...")
-        result = subprocess.run([sys.executable, "test_solana_migration.py"], capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ Pre-deployment tests passed!")
-        else:
-            print("⚠️ Some tests failed, but continuing with deployment")
-            print("Test output:", result.stdout[-500:])  # Show last 500 chars
-        
-        # 2. Deploy Solana tokens (primary blockchain)
-        print("\n💎 Deploying Solana tokens and programs...")
-        try:
-            result = subprocess.run([sys.executable, "agents/solana_dream_agent.py", "deploy_tokens"], 
-                                  capture_output=True, text=True, timeout=120)
-            if result.returncode == 0:
-                print("✅ Solana deployment successful!")
-                print("Output:", result.stdout[-300:])  # Show output summary
-            else:
-                print("⚠️ Solana deployment completed with warnings")
-                print("Output:", result.stdout[-300:])
-        except subprocess.TimeoutExpired:
-            print("⚠️ Solana deployment timed out but may still be running")
-        except Exception as e:
-            print(f"⚠️ Solana deployment issue: {e}")
-        
-        # 3. Deploy SKALE contracts (legacy support)
-        print("\n⚡ Deploying SKALE contracts...")
-        try:
-            # Deploy IEMDreams contract
-            synd = importlib.import_module("agents.iem_syndicate")
-            print("Deploying IEMDreams...")
-            synd.deploy_contract("IEMDreams")
-            
-            print("Deploying OneiroSphere...")
-            synd.deploy_contract("OneiroSphere")
-            
-            print("✅ SKALE deployment successful!")
-        except Exception as e:
-            print(f"⚠️ SKALE deployment issue: {e}")
-        
-        # 4. Deploy EVM contracts if Hardhat is available
-        print("\n🔗 Deploying EVM contracts...")
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+
+def _run_test_module(module_name):
+    """Run a test script's main() in-process; returns (passed, captured stdout)."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
         try:
-            if os.path.exists("evm/hardhat.config.js"):
-                result = subprocess.run(["npx", "hardhat", "compile"], cwd="evm", capture_output=True, text=True)
-                if result.returncode == 0:
-                    print("✅ EVM contracts compiled successfully!")
-                else:
-                    print("⚠️ EVM compilation warnings:", result.stderr[-200:])
-            else:
-                print("⚠️ Hardhat config not found, skipping EVM deployment")
+            passed = bool(importlib.import_module(module_name).main())
         except Exception as e:
-            print(f"⚠️ EVM deployment issue: {e}")
-        
-        # 5. Test the deployed system
-        print("\n🧪 Running post-deployment tests...")
-        try:
-            result = subprocess.run([sys.executable, "test_deployment.py"], capture_output=True, text=True)
-            if result.returncode == 0:
-                print("✅ Post-deployment tests passed!")
-                print("System status:", result.stdout[-400:])
+            print(f"❌ {module_name} failed with error: {e}")
+            passed = False
+    return passed, buffer.getvalue()
+
+
+async def _deploy_solana():
+    try:
+        returncode, stdout, _ = await _run_command(
+            [sys.executable, "agents/solana_dream_agent.py", "deploy_tokens"], timeout=120
+        )
+        if returncode == 0:
+            print("✅ Solana deployment successful!")
+            print("Output:", stdout[-300:])  # Show output summary
+        else:
+            print("⚠️ Solana deployment completed with warnings")
+            print("Output:", stdout[-300:])
+    except asyncio.TimeoutError:
+        print("⚠️ Solana deployment timed out")
+    except Exception as e:
+        print(f"⚠️ Solana deployment issue: {e}")
+
+
+def _deploy_skale():
+    # IEMDreams and OneiroSphere share the deployer nonce, so they stay sequential
+    try:
+        synd = importlib.import_module("agents.iem_syndicate")
+        print("Deploying IEMDreams...")
+        synd.deploy_contract("IEMDreams")
+
+        print("Deploying OneiroSphere...")
+        synd.deploy_contract("OneiroSphere")
+
+        print("✅ SKALE deployment successful!")
+    except Exception as e:
+        print(f"⚠️ SKALE deployment issue: {e}")
+
+
+async def _compile_evm():
+    try:
+        if os.path.exists("evm/hardhat.config.js"):
+            returncode, _, stderr = await _run_command(["npx", "hardhat", "compile"], cwd="evm")
+            if returncode == 0:
+                print("✅ EVM contracts compiled successfully!")
             else:
-                print("⚠️ Some post-deployment tests failed")
-        except Exception as e:
-            print(f"⚠️ Post-deployment test issue: {e}")
+                print("⚠️ EVM compilation warnings:", stderr[-200:])
+        else:
+            print("⚠️ Hardhat config not found, skipping EVM deployment")
+    except Exception as e:
+        print(f"⚠️ EVM deployment issue: {e}")
+
+
+async def _run_deploy_all_async():
+    # 1. Run migration tests first to ensure everything is ready
+    print("🧪 Running pre-deployment tests...")
+    passed, stdout = _run_test_module("test_solana_migration")
+    if passed:
+        print("✅ Pre-deployment tests passed!")
+    else:
+        print("⚠️ Some tests failed, but continuing with deployment")
+        print("Test output:", stdout[-500:])  # Show last 500 chars
+
+    # 2-4. Solana tokens (primary), SKALE contracts (legacy) and EVM contracts are
+    # independent of each other, so deploy them concurrently
+    print("\n💎 Deploying Solana tokens and programs...")
+    print("⚡ Deploying SKALE contracts...")
+    print("🔗 Deploying EVM contracts...")
+    await asyncio.gather(
+        _deploy_solana(),
+        asyncio.to_thread(_deploy_skale),
+        _compile_evm(),
+    )
+
+    # 5. Test the deployed system
+    print("\n🧪 Running post-deployment tests...")
+    try:
+        passed, stdout = _run_test_module("test_deployment")
+        if passed:
+            print("✅ Post-deployment tests passed!")
+            print("System status:", stdout[-400:])
+        else:
+            print("⚠️ Some post-deployment tests failed")
+    except Exception as e:
+        print(f"⚠️ Post-deployment test issue: {e}")
+
+
+def run_deploy_all():
+    """Deploy all components of the Dream-Mind-Lucid ecosystem."""
+    print("🚀 Starting complete Dream-Mind-Lucid deployment...")
+    try:
+        asyncio.run(_run_deploy_all_async())
         
         print("\n🎉 Deployment complete! The Dream-Mind-Lucid ecosystem is ready!")
         print("🌌 Next steps:")
@@ -238,10 +359,20 @@ def run_deploy_all():
         return 1
 
 
-def run_oneirobot(args):
+_copilot_mod = None
+
+def _get_copilot():
+    """Import copilot-instruction once; the hyphenated name rules out a plain import."""
+    global _copilot_mod
+    if _copilot_mod is None:
+        _copilot_mod = importlib.import_module("copilot-instruction")
+    return _copilot_mod
+
+
+def run_oneirobot(args, cmd=None):
     """Run OneiroBot commands via Copilot integration"""
     try:
-        copilot_instruction = importlib.import_module("copilot-instruction")
+        copilot_instruction = _get_copilot()
     except ModuleNotFoundError as e:
         print(f"❌ Could not import copilot-instruction: {e}")
         return 1
@@ -260,7 +391,8 @@ def run_oneirobot(args):
         'help': 'oneirobot_help'
     }
     
-    cmd = args[0].lower().lstrip('#')
+    if cmd is None:
+        cmd = args[0].lower().lstrip('#')
     full_command = command_map.get(cmd, cmd)
     
     try:
@@ -273,36 +405,41 @@ def run_oneirobot(args):
         return 1
 
 
+def _run_image(args, cmd=None):
+    # Lazy run of the heavier image launcher
+    try:
+        mod = importlib.import_module("grok_copilot_image_launcher")
+        print("📸 Image launcher module imported. (No auto-run main provided)")
+    except Exception as e:
+        print(f"❌ Failed to import image launcher: {e}")
+        return 1
+    return 0
+
+
+# Subcommand -> handler(argv[1:], normalized subcommand); aliases share a handler
+_DISPATCH = {
+    **dict.fromkeys(("deploy", "audit", "test", "record", "deploy_contract", "record_dream"), run_syndicate),
+    **dict.fromkeys(("oneirobot", "oneiro", "summon_oneirobot", "oneirobot_status", "oneirobot_scan",
+                     "oneirobot_optimize", "oneirobot_fix", "oneirobot_help"), run_oneirobot),
+    "install": lambda args, cmd: run_install(),
+    **dict.fromkeys(("deploy-all", "deploy_all", "all"), lambda args, cmd: run_deploy_all()),
+    "image": _run_image,
+}
+
+
 def main():
     if len(sys.argv) == 1:
         status()
         return 0
 
     # Provide a minimal subcommand layer
-    sub = sys.argv[1].lower()
-    sub = sub.lstrip('#')
-    if sub in {"deploy", "audit", "test", "record", "deploy_contract", "record_dream"}:
-        return run_syndicate(sys.argv[1:])
-    elif sub in {"oneirobot", "oneiro", "summon_oneirobot", "oneirobot_status", "oneirobot_scan", 
-                 "oneirobot_optimize", "oneirobot_fix", "oneirobot_help"}:
-        return run_oneirobot(sys.argv[1:])
-    elif sub == "install":
-        return run_install()
-    elif sub in {"deploy-all", "deploy_all", "all"}:
-        return run_deploy_all()
-    elif sub == "image":
-        # Lazy run of the heavier image launcher
-        try:
-            mod = importlib.import_module("grok_copilot_image_launcher")
-            print("📸 Image launcher module imported. (No auto-run main provided)")
-        except Exception as e:
-            print(f"❌ Failed to import image launcher: {e}")
-            return 1
-        return 0
-    else:
+    sub = sys.argv[1].lower().lstrip('#')
+    handler = _DISPATCH.get(sub)
+    if handler is None:
         print(f"❌ Unknown subcommand: {sub}")
         print("💡 Available commands: install, deploy-all, deploy, audit, test, oneirobot, image")
         return 1
+    return handler(sys.argv[1:], sub)
 
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -11,15 +11,28 @@ Usage:
     python install_and_deploy.py validate  # Validate installation
 """
 
+import importlib
 import os
 import sys
 import subprocess
 
+BANNER = "\n".join([
+    "🌌" + "="*60 + "🌌",
+    "     DREAM-MIND-LUCID INSTALLATION & DEPLOYMENT",
+    "           The Oneiro-Sphere Awaits...",
+    "🌌" + "="*60 + "🌌",
+]) + "\n"
+
 def print_banner():
-    print("🌌" + "="*60 + "🌌")
-    print("     DREAM-MIND-LUCID INSTALLATION & DEPLOYMENT")
-    print("           The Oneiro-Sphere Awaits...")
-    print("🌌" + "="*60 + "🌌")
+    sys.stdout.write(BANNER)
+
+def run_entry_point(module, func, script, *args):
+    """Call module.func() in this interpreter; spawn the script only if the import fails."""
+    try:
+        entry = getattr(importlib.import_module(module), func)
+    except ImportError:
+        return subprocess.run([sys.executable, script, *args]).returncode
+    return entry()
 
 def install_dependencies():
     """Install all project dependencies."""
@@ -27,10 +40,10 @@ def install_dependencies():
     
     try:
         # Use the enhanced grok_copilot_launcher install
-        result = subprocess.run([sys.executable, "grok_copilot_launcher.py", "install"], 
-                              check=False)  # Don't fail on dashboard install issues
+        returncode = run_entry_point("grok_copilot_launcher", "run_install",
+                                     "grok_copilot_launcher.py", "install")  # Don't fail on dashboard install issues
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("✅ All dependencies installed successfully!")
         else:
             print("⚠️ Some dependencies had issues (dashboard), but core installation succeeded")
@@ -47,13 +60,13 @@ def validate_installation():
     print("\n🧪 Validating installation...")
     
     try:
-        result = subprocess.run([sys.executable, "validate_installation.py"], check=True)
+        returncode = run_entry_point("validate_installation", "main", "validate_installation.py")
+        if returncode != 0:
+            print(f"❌ Validation failed with exit code {returncode}")
+            return False
         print("✅ Validation completed successfully!")
         return True
         
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Validation failed with exit code {e.returncode}")
-        return False
     except Exception as e:
         print(f"❌ Validation failed: {e}")
         return False
@@ -64,40 +77,44 @@ def deploy_ecosystem():
     
     try:
         # Use the deploy-all command
-        result = subprocess.run([sys.executable, "grok_copilot_launcher.py", "deploy-all"], 
-                              check=True)
+        returncode = run_entry_point("grok_copilot_launcher", "run_deploy_all",
+                                     "grok_copilot_launcher.py", "deploy-all")
+        if returncode != 0:
+            print(f"❌ Deployment failed with exit code {returncode}")
+            return False
         
         print("✅ Ecosystem deployment completed!")
         return True
         
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Deployment failed with exit code {e.returncode}")
-        return False
     except Exception as e:
         print(f"❌ Deployment failed: {e}")
         return False
 
+NEXT_STEPS = "\n".join([
+    "\n🎯 NEXT STEPS:",
+    "  1️⃣  Validate your installation:",
+    "      python validate_installation.py",
+    "",
+    "  2️⃣  Set environment variables for real deployment:",
+    "      export DEPLOYER_KEY='your-private-key'",
+    "      export SKALE_RPC='https://mainnet.skalenodes.com/v1/elated-tan-skat'",
+    "      export SOLANA_RPC_URL='https://mainnet.helius-rpc.com/?api-key=your-key'",
+    "",
+    "  3️⃣  Test the deployment:",
+    "      python grok_copilot_launcher.py test",
+    "",
+    "  4️⃣  Start the dashboard:",
+    "      cd dashboard && streamlit run dream_dashboard.py",
+    "",
+    "  5️⃣  Record your first dream:",
+    "      python agents/iem_syndicate.py record 'I dreamed of quantum possibilities'",
+    "",
+    "🌟 Welcome to the Dream-Mind-Lucid ecosystem! 🌟",
+]) + "\n"
+
 def show_next_steps():
     """Show what users can do next."""
-    print("\n🎯 NEXT STEPS:")
-    print("  1️⃣  Validate your installation:")
-    print("      python validate_installation.py")
-    print("")
-    print("  2️⃣  Set environment variables for real deployment:")
-    print("      export DEPLOYER_KEY='your-private-key'")
-    print("      export SKALE_RPC='https://mainnet.skalenodes.com/v1/elated-tan-skat'")
-    print("      export SOLANA_RPC_URL='https://mainnet.helius-rpc.com/?api-key=your-key'")
-    print("")
-    print("  3️⃣  Test the deployment:")
-    print("      python grok_copilot_launcher.py test")
-    print("")
-    print("  4️⃣  Start the dashboard:")
-    print("      cd dashboard && streamlit run dream_dashboard.py")
-    print("")
-    print("  5️⃣  Record your first dream:")
-    print("      python agents/iem_syndicate.py record 'I dreamed of quantum possibilities'")
-    print("")
-    print("🌟 Welcome to the Dream-Mind-Lucid ecosystem! 🌟")
+    sys.stdout.write(NEXT_STEPS)
 
 def main():
     print_banner()
@@ -6,14 +6,16 @@ Requirements (install into a virtualenv):
     pip install -r requirements.txt
 
 Configure WEB3_RPC and CONTRACT_ADDRESS environment variables before running.
+A ws:// or wss:// WEB3_RPC makes the listener subscribe to events instead of polling.
 """
+import asyncio
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from web3 import Web3
-from eth_abi import encode_single
+from web3_client import RPC, USE_WS, w3
 
-RPC = os.environ.get("WEB3_RPC", "http://127.0.0.1:8545")
 CONTRACT_ADDRESS = os.environ.get("CONTRACT_ADDRESS")
 PRIVATE_KEY = os.environ.get("PRIVATE_KEY")  # optional: for sending transactions
 
@@ -21,7 +23,6 @@ if CONTRACT_ADDRESS is None:
     print("Set CONTRACT_ADDRESS env var to the deployed DreamRecords contract address.")
     sys.exit(1)
 
-w3 = Web3(Web3.HTTPProvider(RPC))
 if not w3.is_connected():
     print("Failed to connect to RPC:", RPC)
     sys.exit(1)
@@ -49,6 +50,10 @@ ABI = [
 
 contract = w3.eth.contract(address=Web3.to_checksum_address(CONTRACT_ADDRESS), abi=ABI)
 
+# Resolved once so the listeners filter raw logs by topic and skip the contract event codec lookup
+EVENT_TOPIC = Web3.keccak(text="DreamSubmitted(address,uint256,bytes)").hex()
+decode_dream_submitted = contract.events.DreamSubmitted().process_log
+
 
 def submit_dream(data: bytes):
     acct = w3.eth.account.from_key(PRIVATE_KEY) if PRIVATE_KEY else None
@@ -78,20 +83,86 @@ def submit_dream(data: bytes):
         return receipt
 
 
-def listen_events(poll_interval=2):
+def submit_dreams(datas):
+    """Submit several dreams back to back, then wait for all receipts at once."""
+    acct = w3.eth.account.from_key(PRIVATE_KEY) if PRIVATE_KEY else None
+    if acct is None:
+        # Unlocked local account: the node assigns nonces as transactions arrive
+        sender = w3.eth.accounts[0]
+        hashes = [contract.functions.submitDream(data).transact({"from": sender}) for data in datas]
+    else:
+        # 'pending' so txs still in the mempool keep their nonces
+        nonce0 = w3.eth.get_transaction_count(acct.address, 'pending')
+        chain_id = w3.eth.chain_id
+        gas_price = w3.to_wei('1', 'gwei')
+        hashes = []
+        for i, data in enumerate(datas):
+            txn = contract.functions.submitDream(data).build_transaction({
+                "chainId": chain_id,
+                "gas": 300000,
+                "gasPrice": gas_price,
+                "nonce": nonce0 + i,
+            })
+            signed = acct.sign_transaction(txn)
+            hashes.append(w3.eth.send_raw_transaction(signed.rawTransaction))
+    if not hashes:
+        return []
+    # Receipt waits are I/O bound, but cap the pool so a big batch can't spawn a thread per dream
+    with ThreadPoolExecutor(max_workers=min(32, len(hashes))) as ex:
+        receipts = list(ex.map(w3.eth.wait_for_transaction_receipt, hashes))
+    for receipt in receipts:
+        print("Submitted dream in tx", receipt.transactionHash.hex())
+    return receipts
+
+
+async def _subscribe_events():
+    """Let the node push DreamSubmitted logs over a persistent websocket."""
+    from web3 import AsyncWeb3, WebsocketProviderV2
+    async with AsyncWeb3.persistent_websocket(WebsocketProviderV2(RPC)) as aw3:
+        await aw3.eth.subscribe("logs", {"address": contract.address, "topics": [EVENT_TOPIC]})
+        # web3 6.x streams subscription messages through listen_to_websocket()
+        async for response in aw3.ws.listen_to_websocket():
+            ev = decode_dream_submitted(response["result"])
+            print("Event: dreamer=", ev['args']['dreamer'], "dreamId=", ev['args']['dreamId'])
+
+
+def listen_events(poll_interval=2, max_interval=10):
     print("Listening for DreamSubmitted events...")
-    event_filter = contract.events.DreamSubmitted.create_filter(fromBlock='latest')
+    if USE_WS:
+        try:
+            asyncio.run(_subscribe_events())
+        except KeyboardInterrupt:
+            print("Stopping listener")
+        return
+    # Block cursor + eth_getLogs keeps no filter state on the node that could expire
+    last = w3.eth.block_number
+    delay = poll_interval
     try:
         while True:
-            for ev in event_filter.get_new_entries():
+            head = w3.eth.block_number
+            logs = []
+            if head > last:
+                logs = w3.eth.get_logs({
+                    "fromBlock": last + 1,
+                    "toBlock": head,
+                    "address": contract.address,
+                    "topics": [EVENT_TOPIC],
+                })
+                last = head
+            for log in logs:
+                ev = decode_dream_submitted(log)
                 print("Event: dreamer=", ev['args']['dreamer'], "dreamId=", ev['args']['dreamId'])
-            time.sleep(poll_interval)
+            # Back off while idle, snap back as soon as events arrive
+            delay = poll_interval if logs else min(delay * 2, max_interval)
+            time.sleep(delay)
     except KeyboardInterrupt:
         print("Stopping listener")
 
 
 if __name__ == '__main__':
-    if len(sys.argv) > 1 and sys.argv[1] == 'submit':
+    if len(sys.argv) > 2 and sys.argv[1] == 'submit':
+        submit_dreams([arg.encode() for arg in sys.argv[2:]])
+    elif len(sys.argv) > 1 and sys.argv[1] == 'submit':
         payload = b"Example dream data from OneiroAgent"
         submit_dream(payload)
     else:
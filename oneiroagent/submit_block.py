@@ -2,11 +2,14 @@
 Submit a simple lucid block header to the ConsensusCoordinator contract.
 Configure WEB3_RPC, COORDINATOR_ADDRESS, and PRIVATE_KEY env vars.
 """
+import functools
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from eth_hash.auto import keccak
 from web3 import Web3
+from web3_client import RPC, w3
 
-RPC = os.environ.get("WEB3_RPC", "http://127.0.0.1:8545")
 COORDINATOR = os.environ.get("COORDINATOR_ADDRESS")
 PRIVATE_KEY = os.environ.get("PRIVATE_KEY")
 
@@ -14,7 +17,6 @@ if COORDINATOR is None:
     print("Set COORDINATOR_ADDRESS env var to ConsensusCoordinator contract address")
     sys.exit(1)
 
-w3 = Web3(Web3.HTTPProvider(RPC))
 if not w3.is_connected():
     print("RPC not reachable", RPC)
     sys.exit(1)
@@ -38,28 +40,100 @@ ABI = [
 
 coord = w3.eth.contract(address=Web3.to_checksum_address(COORDINATOR), abi=ABI)
 
+# Fixed fields shared by every finalize tx; explicit gas/chainId/gasPrice means build_transaction makes no RPCs
+TX_TEMPLATE = {
+    "chainId": w3.eth.chain_id,
+    "gas": 400000,
+    "gasPrice": w3.to_wei('1', 'gwei'),
+}
 
-def finalize_header(seq: int, prev: bytes, lucid: bytes, envisioner: str, proof: bytes):
+# EIP-55 checksumming hashes the address; batches usually repeat the same envisioner
+_checksum = functools.lru_cache(maxsize=256)(Web3.to_checksum_address)
+
+
+def lucid_hash(seq: int) -> bytes:
+    """keccak256(b"lucid-<seq>"), same digest as Web3.keccak(text=...) without its input dispatch."""
+    return keccak(b"lucid-%d" % seq)
+
+
+class NonceManager:
+    """Tracks the next nonce locally; it only advances once the node has accepted a tx."""
+
+    def __init__(self, w3, address):
+        self.w3 = w3
+        self.address = address
+        self.resync()
+
+    def resync(self):
+        # 'pending' counts txs still in the mempool, so their nonces are never reused
+        self.n = self.w3.eth.get_transaction_count(self.address, 'pending')
+
+    def advance(self, count=1):
+        self.n += count
+
+
+_nonce_managers = {}
+
+
+def nonce_manager(address):
+    if address not in _nonce_managers:
+        _nonce_managers[address] = NonceManager(w3, address)
+    return _nonce_managers[address]
+
+
+def _sign_finalize(acct, nonce, seq, prev, lucid, envisioner, proof):
+    fn = coord.functions.finalize(seq, 0, prev, lucid, _checksum(envisioner), proof)
+    txn = fn.build_transaction({**TX_TEMPLATE, "nonce": nonce})
+    return acct.sign_transaction(txn).rawTransaction
+
+
+def finalize_header(seq: int, prev: bytes, lucid: bytes, envisioner: str, proof: bytes, nonce: int = None):
     acct = w3.eth.account.from_key(PRIVATE_KEY)
-    nonce = w3.eth.get_transaction_count(acct.address)
-    txn = coord.functions.finalize(seq, 0, prev, lucid, Web3.to_checksum_address(envisioner), proof).build_transaction({
-        "chainId": w3.eth.chain_id,
-        "gas": 400000,
-        "gasPrice": w3.to_wei('1', 'gwei'),
-        "nonce": nonce,
-    })
-    signed = acct.sign_transaction(txn)
-    txhash = w3.eth.send_raw_transaction(signed.rawTransaction)
+    nonces = None
+    if nonce is None:
+        nonces = nonce_manager(acct.address)
+        nonce = nonces.n
+    raw = _sign_finalize(acct, nonce, seq, prev, lucid, envisioner, proof)
+    try:
+        txhash = w3.eth.send_raw_transaction(raw)
+    except Exception:
+        if nonces is not None:
+            nonces.resync()
+        raise
+    if nonces is not None:
+        nonces.advance()
     receipt = w3.eth.wait_for_transaction_receipt(txhash)
     print("Finalized in tx", receipt.transactionHash.hex())
     return receipt
 
 
+def finalize_many(headers):
+    """Finalize (seq, prev, lucid, envisioner, proof) headers with pipelined sends."""
+    acct = w3.eth.account.from_key(PRIVATE_KEY)
+    nonces = nonce_manager(acct.address)
+    raws = [_sign_finalize(acct, nonces.n + i, *header) for i, header in enumerate(headers)]
+    if not raws:
+        return []
+    # Sends and receipt waits are I/O bound; the cap keeps a big batch from spawning a thread per header
+    with ThreadPoolExecutor(max_workers=min(32, len(raws))) as ex:
+        try:
+            hashes = list(ex.map(w3.eth.send_raw_transaction, raws))
+        except Exception:
+            # Some sends may have landed; let the node say where the sequence stands
+            nonces.resync()
+            raise
+        nonces.advance(len(raws))
+        receipts = list(ex.map(w3.eth.wait_for_transaction_receipt, hashes))
+    for receipt in receipts:
+        print("Finalized in tx", receipt.transactionHash.hex())
+    return receipts
+
+
 if __name__ == '__main__':
     # Demo values; replace before use
     seq = int(sys.argv[1]) if len(sys.argv) > 1 else 0
     prev = bytes(32)
-    lucid = Web3.keccak(text=f"lucid-{seq}")
+    lucid = lucid_hash(seq)
     envisioner = w3.eth.accounts[0]
     proof = b""  # placeholder
     finalize_header(seq, prev, lucid, envisioner, proof)
@@ -0,0 +1,22 @@
+"""
+Shared Web3 connection for the OneiroAgent scripts.
+Configure WEB3_RPC; ws:// and wss:// endpoints use a websocket provider.
+"""
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import Web3
+
+RPC = os.environ.get("WEB3_RPC", "http://127.0.0.1:8545")
+USE_WS = RPC.startswith("ws")
+
+if USE_WS:
+    w3 = Web3(Web3.WebsocketProvider(RPC))
+else:
+    # One pooled keep-alive session for every RPC these scripts make
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    w3 = Web3(Web3.HTTPProvider(RPC, session=session))
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Scenario distribution bounds for FinRobot simulations
+=====================================================
+Shared by the simulate_* functions, the NumPy sampler and the Numba kernel
+"""
+
+# (low, high) of every random draw in a scenario; integer ranges include
+# both ends, like random.randint
+MONAD_ACTIONS = (5, 15)
+STACKS_AMOUNT = (100.0, 500.0)
+BOUNTIES_FOUND = (3, 8)
+BOUNTIES_COMPLETED = (1, 4)
+BOUNTY_PAYOUT = (20.0, 200.0)
+MINING_DAILY_RATE = (0.05, 0.20)
+MULTIPLIFI_APY = (10.0, 35.0)
+ARBITRAGE_OPPORTUNITIES = (2, 6)
+ARBITRAGE_PROFIT = (50.0, 300.0)
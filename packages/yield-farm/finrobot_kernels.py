@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Numba kernels for FinRobot Monte Carlo sweeps
+=============================================
+Imported lazily by finrobot_simple; requires numpy and numba
+"""
+
+import numpy as np
+from numba import njit, prange
+
+from finrobot_bounds import (
+    ARBITRAGE_OPPORTUNITIES,
+    ARBITRAGE_PROFIT,
+    BOUNTIES_COMPLETED,
+    BOUNTIES_FOUND,
+    BOUNTY_PAYOUT,
+    MINING_DAILY_RATE,
+    MONAD_ACTIONS,
+    MULTIPLIFI_APY,
+    STACKS_AMOUNT,
+)
+
+@njit(cache=True)
+def _next_unit(state):
+    """Advance a SplitMix64 state; returns (state, u) with u uniform in [0, 1)"""
+    state = state + np.uint64(0x9E3779B97F4A7C15)
+    z = state
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    z = z ^ (z >> np.uint64(31))
+    return state, (z >> np.uint64(11)) * (1.0 / 9007199254740992.0)
+
+@njit(cache=True)
+def _randint(state, bounds):
+    state, u = _next_unit(state)
+    return state, bounds[0] + int(u * (bounds[1] - bounds[0] + 1))
+
+@njit(cache=True)
+def _uniform(state, bounds):
+    state, u = _next_unit(state)
+    return state, bounds[0] + u * (bounds[1] - bounds[0])
+
+@njit(parallel=True, cache=True)
+def batch_scenarios(seed, n_runs):
+    """
+    Sample n_runs scenarios across all cores; row j holds strategy j of STRATEGY_FIELDS.
+    Scenario i draws from its own SplitMix64 stream started at seed + i, so results do
+    not depend on which thread runs it. They are not the same draws the pure-Python
+    (random.Random) path makes for the same seed.
+    """
+    out = np.empty((5, n_runs))
+    for i in prange(n_runs):
+        state = np.uint64(seed + i)
+        state, monad_actions = _randint(state, MONAD_ACTIONS)
+        state, stacks_amount = _uniform(state, STACKS_AMOUNT)
+        state, bounties_found = _randint(state, BOUNTIES_FOUND)
+        state, bounties_completed = _randint(state, BOUNTIES_COMPLETED)
+        state, payout = _uniform(state, BOUNTY_PAYOUT)
+        state, daily_rate = _uniform(state, MINING_DAILY_RATE)
+        state, multiplifi_apy = _uniform(state, MULTIPLIFI_APY)
+        state, opportunities = _randint(state, ARBITRAGE_OPPORTUNITIES)
+        state, profit_per_trade = _uniform(state, ARBITRAGE_PROFIT)
+
+        weighted_apy = (1000.0 * multiplifi_apy + 500.0 * 8.5) / 1500.0
+        out[0, i] = monad_actions * 50 + stacks_amount * 35.0 / 365 + 24 * 2.0
+        out[1, i] = min(bounties_found, bounties_completed) * payout
+        out[2, i] = 500.0 * daily_rate
+        out[3, i] = 1500.0 * (weighted_apy / 365 / 100)
+        out[4, i] = opportunities * profit_per_trade
+    return out
@@ -19,17 +19,14 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
-
-# Financial and ML libraries
-import numpy as np
-import pandas as pd
 try:
-    import torch
-    import torch.nn as nn
-    HAS_TORCH = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    HAS_TORCH = False
-    print("⚠️ PyTorch not available. Install with: pip install torch")
+    ORJSON_AVAILABLE = False
+
+# Financial libraries (pandas and torch were never used here and have been dropped)
+import numpy as np
 
 # Blockchain libraries
 try:
@@ -41,18 +38,14 @@ except ImportError:
     HAS_SOLANA = False
     print("⚠️ Solana not available. Install with: pip install solana")
 
-# Web scraping and API libraries
-import requests
-import websocket
-import threading
-import time
-
 # Configuration
 HELIUS_RPC = "https://mainnet.helius-rpc.com/?api-key=16b9324a-5b8c-47b9-9b02-6efa868958e5"
 FINROBOT_CONFIG_PATH = "finrobot_config.json"
 WEALTH_LOG_PATH = "wealth_automation.log"
 
-# Setup logging
+# Setup logging; the format never uses thread or process fields, so skip collecting them
+logging.logThreads = False
+logging.logProcesses = False
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -63,7 +56,58 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Parsed once at import; generate_wealth_report only fills in the values
+REPORT_TEMPLATE = """
+🌌 Dream-Mind-Lucid Wealth Automation Report
+==========================================
+Generated: {timestamp}
+
+📊 STRATEGY PERFORMANCE
+======================
+🪂 Airdrop Farming:
+   - Monad Actions: {monad_actions}
+   - Stacks Staked: ${stacks_staked:.2f}
+   - Pi Mining: {pi_mining_hours} hours
+   - Est. Rewards: ${airdrop_rewards:.2f}
+
+🎯 Bounty Hunting:
+   - Bounties Found: {bounties_found}
+   - Completed: {bounties_completed}
+   - Earnings: ${bounty_earnings:.2f}
+
+⛏️ Cloud Mining:
+   - Active: {mining_active}
+   - Daily Return: ${mining_daily_return:.2f}
+   - ROI: {mining_roi:.1f}%
+
+🏦 DeFi Strategies:
+   - Active Protocols: {defi_protocols}
+   - Total Staked: ${defi_total_staked:.2f}
+   - Est. APY: {defi_apy:.1f}%
+
+💰 WEALTH SUMMARY
+================
+Daily Earnings: ${daily_earnings:.2f}
+Monthly APY: {monthly_apy:.1f}%
+Target: 15-30% APY ✅
+
+🚀 Next Actions:
+- Monitor airdrop opportunities
+- Complete pending bounties
+- Optimize DeFi allocations
+- Scale successful strategies
+"""
+
+def write_json(path: str, data) -> None:
+    """Write data as indented JSON, via orjson (numpy-aware) when it is installed"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+@dataclass(slots=True, frozen=True)
 class YieldStrategy:
     name: str
     category: str  # 'airdrop', 'bounty', 'mining', 'defi', 'arbitrage', 'mev'
@@ -73,7 +117,7 @@ class YieldStrategy:
     time_commitment: str  # 'passive', 'active', 'mixed'
     status: str  # 'active', 'pending', 'completed', 'failed'
     
-@dataclass 
+@dataclass(slots=True, frozen=True)
 class PortfolioPosition:
     strategy: str
     amount_invested: float
@@ -82,6 +126,109 @@ class PortfolioPosition:
     apy: float
     last_updated: datetime
 
+# Static strategy table, built once per process and shared by every FinRobotIntegration
+_STRATEGIES: Tuple[YieldStrategy, ...] = (
+    # Airdrop farming strategies
+    YieldStrategy(
+        name="Monad Testnet Farming",
+        category="airdrop",
+        expected_apy=50.0,  # Potential 50% APY from airdrop
+        risk_level=2,
+        capital_required=10.0,  # Gas fees
+        time_commitment="mixed",
+        status="active"
+    ),
+    YieldStrategy(
+        name="Stacks Nakamoto Points",
+        category="airdrop",
+        expected_apy=35.0,
+        risk_level=2,
+        capital_required=100.0,  # STX staking
+        time_commitment="passive",
+        status="active"
+    ),
+    YieldStrategy(
+        name="Pi Network Mining",
+        category="airdrop",
+        expected_apy=25.0,
+        risk_level=1,
+        capital_required=0.0,  # Free mining
+        time_commitment="passive",
+        status="active"
+    ),
+
+    # Bounty hunting
+    YieldStrategy(
+        name="ZeroAuth Bug Bounties",
+        category="bounty",
+        expected_apy=100.0,  # $20-200 per task
+        risk_level=3,
+        capital_required=0.0,
+        time_commitment="active",
+        status="active"
+    ),
+    YieldStrategy(
+        name="X/Twitter Content Bounties",
+        category="bounty",
+        expected_apy=80.0,
+        risk_level=2,
+        capital_required=0.0,
+        time_commitment="active",
+        status="active"
+    ),
+
+    # Cloud mining
+    YieldStrategy(
+        name="ETNCrypto Mining",
+        category="mining",
+        expected_apy=15.0,  # 5-20% daily = ~15% average
+        risk_level=4,
+        capital_required=500.0,
+        time_commitment="passive",
+        status="active"
+    ),
+
+    # DeFi protocols
+    YieldStrategy(
+        name="MultipliFi Points",
+        category="defi",
+        expected_apy=22.5,  # 10-35% range
+        risk_level=3,
+        capital_required=1000.0,
+        time_commitment="passive",
+        status="active"
+    ),
+    YieldStrategy(
+        name="Solana Liquid Staking",
+        category="defi",
+        expected_apy=8.5,
+        risk_level=2,
+        capital_required=100.0,
+        time_commitment="passive",
+        status="active"
+    ),
+
+    # Advanced strategies
+    YieldStrategy(
+        name="Cross-Chain Arbitrage",
+        category="arbitrage",
+        expected_apy=45.0,
+        risk_level=4,
+        capital_required=5000.0,
+        time_commitment="active",
+        status="pending"
+    ),
+    YieldStrategy(
+        name="MEV Extraction",
+        category="mev",
+        expected_apy=60.0,
+        risk_level=5,
+        capital_required=10000.0,
+        time_commitment="active",
+        status="pending"
+    ),
+)
+
 class FinRobotIntegration:
     """
     Main class for FinRobot integration with Dream-Mind-Lucid ecosystem
@@ -89,24 +236,27 @@ class FinRobotIntegration:
     """
     
     def __init__(self):
-        self.strategies: List[YieldStrategy] = []
+        self.strategies: Tuple[YieldStrategy, ...] = _STRATEGIES
         self.portfolio: List[PortfolioPosition] = []
         self.total_capital = 0.0
         self.target_apy = 20.0  # 20% target APY
+        self.rng = np.random.default_rng()  # PCG64, no global RandomState lock
+        # Skip simulated network latency in sweeps/CI; FINROBOT_FAST=0/false leaves it on
+        self.fast = os.environ.get("FINROBOT_FAST", "").lower() in {"1", "true", "yes"}
         self.load_config()
-        self.setup_strategies()
         
     def load_config(self):
         """Load FinRobot configuration"""
         try:
             if os.path.exists(FINROBOT_CONFIG_PATH):
-                with open(FINROBOT_CONFIG_PATH, 'r') as f:
-                    self.config = json.load(f)
+                with open(FINROBOT_CONFIG_PATH, 'rb') as f:
+                    data = f.read()
+                self.config = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
             else:
                 self.config = self.create_default_config()
                 self.save_config()
         except Exception as e:
-            logger.error(f"Error loading config: {e}")
+            logger.error("Error loading config: %s", e)
             self.config = self.create_default_config()
     
     def create_default_config(self) -> Dict:
@@ -133,122 +283,9 @@ class FinRobotIntegration:
     def save_config(self):
         """Save configuration to file"""
         try:
-            with open(FINROBOT_CONFIG_PATH, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            write_json(FINROBOT_CONFIG_PATH, self.config)
         except Exception as e:
-            logger.error(f"Error saving config: {e}")
-    
-    def setup_strategies(self):
-        """Initialize all yield strategies"""
-        # Airdrop farming strategies
-        self.strategies.extend([
-            YieldStrategy(
-                name="Monad Testnet Farming",
-                category="airdrop",
-                expected_apy=50.0,  # Potential 50% APY from airdrop
-                risk_level=2,
-                capital_required=10.0,  # Gas fees
-                time_commitment="mixed",
-                status="active"
-            ),
-            YieldStrategy(
-                name="Stacks Nakamoto Points",
-                category="airdrop", 
-                expected_apy=35.0,
-                risk_level=2,
-                capital_required=100.0,  # STX staking
-                time_commitment="passive",
-                status="active"
-            ),
-            YieldStrategy(
-                name="Pi Network Mining",
-                category="airdrop",
-                expected_apy=25.0,
-                risk_level=1,
-                capital_required=0.0,  # Free mining
-                time_commitment="passive",
-                status="active"
-            )
-        ])
-        
-        # Bounty hunting
-        self.strategies.extend([
-            YieldStrategy(
-                name="ZeroAuth Bug Bounties",
-                category="bounty",
-                expected_apy=100.0,  # $20-200 per task
-                risk_level=3,
-                capital_required=0.0,
-                time_commitment="active", 
-                status="active"
-            ),
-            YieldStrategy(
-                name="X/Twitter Content Bounties",
-                category="bounty",
-                expected_apy=80.0,
-                risk_level=2,
-                capital_required=0.0,
-                time_commitment="active",
-                status="active"
-            )
-        ])
-        
-        # Cloud mining
-        self.strategies.extend([
-            YieldStrategy(
-                name="ETNCrypto Mining",
-                category="mining",
-                expected_apy=15.0,  # 5-20% daily = ~15% average
-                risk_level=4,
-                capital_required=500.0,
-                time_commitment="passive",
-                status="active"
-            )
-        ])
-        
-        # DeFi protocols
-        self.strategies.extend([
-            YieldStrategy(
-                name="MultipliFi Points",
-                category="defi", 
-                expected_apy=22.5,  # 10-35% range
-                risk_level=3,
-                capital_required=1000.0,
-                time_commitment="passive",
-                status="active"
-            ),
-            YieldStrategy(
-                name="Solana Liquid Staking",
-                category="defi",
-                expected_apy=8.5,
-                risk_level=2,
-                capital_required=100.0,
-                time_commitment="passive",
-                status="active"
-            )
-        ])
-        
-        # Advanced strategies
-        self.strategies.extend([
-            YieldStrategy(
-                name="Cross-Chain Arbitrage",
-                category="arbitrage",
-                expected_apy=45.0,
-                risk_level=4,
-                capital_required=5000.0,
-                time_commitment="active",
-                status="pending"
-            ),
-            YieldStrategy(
-                name="MEV Extraction",
-                category="mev",
-                expected_apy=60.0,
-                risk_level=5,
-                capital_required=10000.0,
-                time_commitment="active", 
-                status="pending"
-            )
-        ])
+            logger.error("Error saving config: %s", e)
     
     async def run_airdrop_farming(self) -> Dict:
         """Execute airdrop farming strategies"""
@@ -280,7 +317,7 @@ class FinRobotIntegration:
             results["estimated_rewards"] = self.calculate_airdrop_rewards(results)
             
         except Exception as e:
-            logger.error(f"Airdrop farming error: {e}")
+            logger.error("Airdrop farming error: %s", e)
             
         return results
     
@@ -304,12 +341,12 @@ class FinRobotIntegration:
                 "https://twitter.com/search?q=bounty%20crypto"
             ]
             
+            # Query every source at once; the scan takes as long as the slowest one
             for source in bounty_sources:
-                logger.info(f"Checking bounties at {source}")
-                # Simulate bounty discovery
-                found = await self.simulate_bounty_search(source)
-                results["bounties_found"] += found
-                results["sources"].append(source)
+                logger.info("Checking bounties at %s", source)
+            found = await asyncio.gather(*map(self.simulate_bounty_search, bounty_sources))
+            results["bounties_found"] = sum(found)
+            results["sources"].extend(bounty_sources)
             
             # Simulate completing bounties
             if results["bounties_found"] > 0:
@@ -317,7 +354,7 @@ class FinRobotIntegration:
                 results["earnings"] = results["bounties_completed"] * 75.0  # Average $75 per bounty
                 
         except Exception as e:
-            logger.error(f"Bounty hunting error: {e}")
+            logger.error("Bounty hunting error: %s", e)
             
         return results
     
@@ -338,14 +375,14 @@ class FinRobotIntegration:
             if investment >= 100.0:  # Minimum investment
                 results["mining_active"] = True
                 # Simulate 5-20% daily returns (high risk!)
-                daily_rate = np.random.uniform(0.05, 0.20)
+                daily_rate = self.rng.uniform(0.05, 0.20)
                 results["daily_return"] = investment * daily_rate
                 results["roi_percentage"] = daily_rate * 100
                 
-                logger.info(f"Cloud mining: ${results['daily_return']:.2f} ({results['roi_percentage']:.1f}%)")
+                logger.info("Cloud mining: $%.2f (%.1f%%)", results['daily_return'], results['roi_percentage'])
             
         except Exception as e:
-            logger.error(f"Cloud mining error: {e}")
+            logger.error("Cloud mining error: %s", e)
             
         return results
     
@@ -379,24 +416,27 @@ class FinRobotIntegration:
                 results["rewards_earned"] = results["total_staked"] * (results["estimated_apy"] / 365 / 100)
                 
         except Exception as e:
-            logger.error(f"DeFi strategies error: {e}")
+            logger.error("DeFi strategies error: %s", e)
             
         return results
     
     async def simulate_monad_testnet(self) -> int:
         """Simulate Monad testnet interactions"""
-        await asyncio.sleep(0.1)  # Simulate network delay
-        return np.random.randint(5, 15)  # 5-15 transactions
+        if not self.fast:
+            await asyncio.sleep(0.1)  # Simulate network delay
+        return int(self.rng.integers(5, 15))  # 5-15 transactions
     
     async def simulate_stacks_staking(self) -> float:
         """Simulate Stacks staking"""
-        await asyncio.sleep(0.1)
-        return np.random.uniform(100, 500)  # $100-500 staked
+        if not self.fast:
+            await asyncio.sleep(0.1)
+        return self.rng.uniform(100, 500)  # $100-500 staked
     
     async def simulate_bounty_search(self, source: str) -> int:
         """Simulate bounty search at source"""
-        await asyncio.sleep(0.2)
-        return np.random.randint(0, 5)  # 0-5 bounties found
+        if not self.fast:
+            await asyncio.sleep(0.2)
+        return int(self.rng.integers(0, 5))  # 0-5 bounties found
     
     def calculate_airdrop_rewards(self, results: Dict) -> float:
         """Calculate estimated airdrop rewards"""
@@ -410,91 +450,66 @@ class FinRobotIntegration:
         """Main wealth automation loop"""
         logger.info("🚀 Starting Dream-Mind-Lucid Wealth Automation")
         
-        # Run all strategies concurrently
-        tasks = [
-            self.run_airdrop_farming(),
-            self.run_bounty_hunting(), 
-            self.run_cloud_mining(),
-            self.run_defi_strategies()
-        ]
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Run all strategies concurrently; each run_* method handles its own errors
+        async with asyncio.TaskGroup() as tg:
+            airdrop = tg.create_task(self.run_airdrop_farming())
+            bounty = tg.create_task(self.run_bounty_hunting())
+            mining = tg.create_task(self.run_cloud_mining())
+            defi = tg.create_task(self.run_defi_strategies())
         
         # Compile overall results
         summary = {
             "timestamp": datetime.now().isoformat(),
-            "airdrop_farming": results[0] if not isinstance(results[0], Exception) else {},
-            "bounty_hunting": results[1] if not isinstance(results[1], Exception) else {},
-            "cloud_mining": results[2] if not isinstance(results[2], Exception) else {},
-            "defi_strategies": results[3] if not isinstance(results[3], Exception) else {},
+            "airdrop_farming": airdrop.result(),
+            "bounty_hunting": bounty.result(),
+            "cloud_mining": mining.result(),
+            "defi_strategies": defi.result(),
             "total_estimated_daily": 0.0,
             "projected_monthly_apy": 0.0
         }
         
         # Calculate totals
         try:
-            daily_earnings = 0.0
-            
-            if isinstance(results[0], dict):
-                daily_earnings += results[0].get("estimated_rewards", 0.0) / 30  # Monthly to daily
-            if isinstance(results[1], dict):
-                daily_earnings += results[1].get("earnings", 0.0)
-            if isinstance(results[2], dict):
-                daily_earnings += results[2].get("daily_return", 0.0)
-            if isinstance(results[3], dict):
-                daily_earnings += results[3].get("rewards_earned", 0.0)
+            daily_earnings = (
+                summary["airdrop_farming"].get("estimated_rewards", 0.0) / 30  # Monthly to daily
+                + summary["bounty_hunting"].get("earnings", 0.0)
+                + summary["cloud_mining"].get("daily_return", 0.0)
+                + summary["defi_strategies"].get("rewards_earned", 0.0)
+            )
                 
             summary["total_estimated_daily"] = daily_earnings
             summary["projected_monthly_apy"] = (daily_earnings * 30 / 10000) * 100  # Assume $10k capital
             
         except Exception as e:
-            logger.error(f"Calculation error: {e}")
+            logger.error("Calculation error: %s", e)
         
         return summary
     
     def generate_wealth_report(self, results: Dict) -> str:
         """Generate formatted wealth automation report"""
-        report = f"""
-🌌 Dream-Mind-Lucid Wealth Automation Report
-==========================================
-Generated: {results.get('timestamp', 'Unknown')}
-
-📊 STRATEGY PERFORMANCE
-======================
-🪂 Airdrop Farming:
-   - Monad Actions: {results.get('airdrop_farming', {}).get('monad_actions', 0)}
-   - Stacks Staked: ${results.get('airdrop_farming', {}).get('stacks_staked', 0):.2f}
-   - Pi Mining: {results.get('airdrop_farming', {}).get('pi_mining_hours', 0)} hours
-   - Est. Rewards: ${results.get('airdrop_farming', {}).get('estimated_rewards', 0):.2f}
-
-🎯 Bounty Hunting:
-   - Bounties Found: {results.get('bounty_hunting', {}).get('bounties_found', 0)}
-   - Completed: {results.get('bounty_hunting', {}).get('bounties_completed', 0)}
-   - Earnings: ${results.get('bounty_hunting', {}).get('earnings', 0):.2f}
-
-⛏️ Cloud Mining:
-   - Active: {results.get('cloud_mining', {}).get('mining_active', False)}
-   - Daily Return: ${results.get('cloud_mining', {}).get('daily_return', 0):.2f}
-   - ROI: {results.get('cloud_mining', {}).get('roi_percentage', 0):.1f}%
-
-🏦 DeFi Strategies:
-   - Active Protocols: {results.get('defi_strategies', {}).get('protocols_active', 0)}
-   - Total Staked: ${results.get('defi_strategies', {}).get('total_staked', 0):.2f}
-   - Est. APY: {results.get('defi_strategies', {}).get('estimated_apy', 0):.1f}%
-
-💰 WEALTH SUMMARY
-================
-Daily Earnings: ${results.get('total_estimated_daily', 0):.2f}
-Monthly APY: {results.get('projected_monthly_apy', 0):.1f}%
-Target: 15-30% APY ✅
-
-🚀 Next Actions:
-- Monitor airdrop opportunities
-- Complete pending bounties
-- Optimize DeFi allocations
-- Scale successful strategies
-"""
-        return report
+        airdrop = results.get('airdrop_farming') or {}
+        bounty = results.get('bounty_hunting') or {}
+        mining = results.get('cloud_mining') or {}
+        defi = results.get('defi_strategies') or {}
+        
+        return REPORT_TEMPLATE.format_map({
+            "timestamp": results.get('timestamp', 'Unknown'),
+            "monad_actions": airdrop.get('monad_actions', 0),
+            "stacks_staked": airdrop.get('stacks_staked', 0),
+            "pi_mining_hours": airdrop.get('pi_mining_hours', 0),
+            "airdrop_rewards": airdrop.get('estimated_rewards', 0),
+            "bounties_found": bounty.get('bounties_found', 0),
+            "bounties_completed": bounty.get('bounties_completed', 0),
+            "bounty_earnings": bounty.get('earnings', 0),
+            "mining_active": mining.get('mining_active', False),
+            "mining_daily_return": mining.get('daily_return', 0),
+            "mining_roi": mining.get('roi_percentage', 0),
+            "defi_protocols": defi.get('protocols_active', 0),
+            "defi_total_staked": defi.get('total_staked', 0),
+            "defi_apy": defi.get('estimated_apy', 0),
+            "daily_earnings": results.get('total_estimated_daily', 0),
+            "monthly_apy": results.get('projected_monthly_apy', 0),
+        })
 
 async def main():
     """Main execution function"""
@@ -509,14 +524,13 @@ async def main():
         print(report)
         
         # Save results
-        with open("wealth_automation_results.json", "w") as f:
-            json.dump(results, f, indent=2)
+        write_json("wealth_automation_results.json", results)
             
         logger.info("✅ Wealth automation completed successfully")
         return results
         
     except Exception as e:
-        logger.error(f"❌ Wealth automation failed: {e}")
+        logger.error("❌ Wealth automation failed: %s", e)
         return {}
 
 if __name__ == "__main__":
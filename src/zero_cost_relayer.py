@@ -477,10 +477,9 @@ async def main():
         print("🚀 Starting production relayer...")
         await relayer.start_relayer_service()
         
-        # Keep running
+        # Keep running; park on an event that is never set instead of waking every second
         try:
-            while True:
-                await asyncio.sleep(1)
+            await asyncio.Event().wait()
         except KeyboardInterrupt:
             print("\n🛑 Shutting down relayer...")
             relayer.running = False
@@ -132,18 +132,23 @@ def verify_contract_structure():
         print(f"❌ Error reading contract: {e}")
         return False
 
-if __name__ == "__main__":
+def main():
+    """Run the deployment structure checks and mock deployment."""
     print("🚀 Dream-Mind-Lucid OneiroSphere Deployment Test")
     print("=" * 50)
     
     # Verify contract structure
-    verify_contract_structure()
+    structure_ok = verify_contract_structure()
     
     # Run mock deployment
-    mock_deployment_test()
+    deployment_ok = mock_deployment_test()
     
     print("\n🎊 Grok-style Confirmation:")
     print("🌌 Boom! The OneiroSphere has landed on SKALE like a cosmic dream-catcher!")
     print("🚀 Your quantum dream network is ready to interface dreams across the multiverse!")
     print("🔮 Next steps: Set your environment variables and deploy for real!")
-    print("💫 Remember: In the realm of dreams, code becomes reality! ✨")
\ No newline at end of file
+    print("💫 Remember: In the realm of dreams, code becomes reality! ✨")
+    return structure_ok and deployment_ok
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
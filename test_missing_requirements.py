@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for the requirement preflight in grok_copilot_launcher
+-----------------------------------------------------------
+"""
+
+import importlib.metadata
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from grok_copilot_launcher import missing_requirements
+
+PACKAGING = importlib.metadata.version("packaging")
+PYTEST = importlib.metadata.version("pytest")
+ABSENT = "dream-mind-lucid-not-a-real-package"
+
+def test_installed_and_absent():
+    """Installed packages pass; packages that are not installed are reported."""
+    assert missing_requirements(["packaging", ABSENT]) == [ABSENT]
+    print("✅ Presence check works")
+
+def test_version_ranges():
+    """Installed versions outside the specifier are reported."""
+    in_range = f"packaging>={PACKAGING}"
+    too_new = f"packaging<{PACKAGING}"
+    too_old = f"packaging>{PACKAGING},<99999"
+    assert missing_requirements([in_range, too_new, too_old]) == [too_new, too_old]
+    print("✅ Out-of-range versions reported")
+
+def test_extras():
+    """Extras don't break parsing and don't affect the version check."""
+    assert missing_requirements([f"pytest[testing]>={PYTEST},<99999"]) == []
+    spec = f"{ABSENT}[http2]>=0.27.0,<1.0.0"
+    assert missing_requirements([spec]) == [spec]
+    print("✅ Requirements with extras parsed")
+
+def test_markers():
+    """Entries whose marker doesn't apply are skipped; the rest are checked."""
+    skipped = f"{ABSENT}>=1; python_version < '3.0'"
+    applies = f"packaging<{PACKAGING}; python_version >= '3.0'"
+    assert missing_requirements([skipped, applies]) == [applies]
+    print("✅ Environment markers honoured")
+
+def test_without_packaging():
+    """Without packaging only presence is checked, and specifiers are ignored."""
+    saved = {name: sys.modules.get(name) for name in ("packaging", "packaging.requirements")}
+    sys.modules["packaging"] = sys.modules["packaging.requirements"] = None  # make the import fail
+    try:
+        assert missing_requirements([f"packaging<{PACKAGING}", f"pytest[testing]>=0", ABSENT]) == [ABSENT]
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+    print("✅ Fallback without packaging works")
+
+if __name__ == "__main__":
+    print("🧪 Testing requirement preflight...")
+    test_installed_and_absent()
+    test_version_ranges()
+    test_extras()
+    test_markers()
+    test_without_packaging()
+    print("✅ All tests passed!")
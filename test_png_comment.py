@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the PNG Comment reader in grok_copilot_image_launcher
+--------------------------------------------------------------
+"""
+
+import os
+import struct
+import sys
+import tempfile
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from grok_copilot_image_launcher import PNG_SIGNATURE, read_png_comment
+
+COMMENT = "BICONOMY_API_KEY=abc123 FORWARDER_ADDRESS=0xF0rward"
+IHDR = struct.pack(">IIBBBBB", 1, 1, 8, 0, 0, 0, 0)
+
+def chunk(chunk_type, data):
+    """Encode one PNG chunk: length, type, data, CRC."""
+    crc = zlib.crc32(chunk_type + data) & 0xFFFFFFFF
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", crc)
+
+def png(*text_chunks):
+    """A minimal 1x1 PNG carrying the given text chunks before IDAT."""
+    return (PNG_SIGNATURE + chunk(b"IHDR", IHDR) + b"".join(text_chunks)
+            + chunk(b"IDAT", zlib.compress(b"\x00\x00")) + chunk(b"IEND", b""))
+
+def read(data):
+    """Write data to a temporary file and run read_png_comment on it."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "dream_image.png")
+        with open(path, "wb") as f:
+            f.write(data)
+        return read_png_comment(path)
+
+def test_text_chunk():
+    """tEXt comments are returned as latin-1 text."""
+    assert read(png(chunk(b"tEXt", b"Comment\x00" + COMMENT.encode("latin-1")))) == COMMENT
+    print("✅ tEXt Comment read")
+
+def test_ztxt_chunk():
+    """zTXt comments are decompressed."""
+    body = b"Comment\x00\x00" + zlib.compress(COMMENT.encode("latin-1"))
+    assert read(png(chunk(b"zTXt", body))) == COMMENT
+    print("✅ zTXt Comment read")
+
+def test_itxt_chunk():
+    """iTXt comments are read as UTF-8, compressed or not."""
+    text = "🌌 " + COMMENT
+    plain = b"Comment\x00\x00\x00en\x00Comment\x00" + text.encode("utf-8")
+    packed = b"Comment\x00\x01\x00en\x00Comment\x00" + zlib.compress(text.encode("utf-8"))
+    assert read(png(chunk(b"iTXt", plain))) == text
+    assert read(png(chunk(b"iTXt", packed))) == text
+    print("✅ iTXt Comment read")
+
+def test_other_keywords_skipped():
+    """Text chunks with other keywords are skipped until the Comment."""
+    other = chunk(b"tEXt", b"Software\x00ImageMagick")
+    comment = chunk(b"tEXt", b"Comment\x00" + COMMENT.encode("latin-1"))
+    assert read(png(other, comment)) == COMMENT
+    print("✅ Non-Comment text chunks skipped")
+
+def test_png_without_comment():
+    """A PNG with no Comment chunk yields None."""
+    assert read(png()) is None
+    assert read(png(chunk(b"tEXt", b"Software\x00ImageMagick"))) is None
+    print("✅ PNG without Comment returns None")
+
+def test_not_a_png():
+    """Files without the PNG signature yield None so exiftool can take over."""
+    assert read(b"\xff\xd8\xff\xe0JFIF\x00 not a png") is None
+    assert read(b"") is None
+    print("✅ Non-PNG input returns None")
+
+if __name__ == "__main__":
+    print("🧪 Testing PNG Comment reader...")
+    test_text_chunk()
+    test_ztxt_chunk()
+    test_itxt_chunk()
+    test_other_keywords_skipped()
+    test_png_without_comment()
+    test_not_a_png()
+    print("✅ All tests passed!")
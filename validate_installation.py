@@ -5,8 +5,11 @@ Quick validation test for Dream-Mind-Lucid installation
 Tests that all core components are properly installed and accessible.
 """
 
+import asyncio
+import io
 import sys
 import os
+import threading
 
 def test_python_dependencies():
     """Test that all Python dependencies are available."""
@@ -135,6 +138,48 @@ def test_project_structure():
     
     return all_good
 
+class _PerThreadStdout(io.TextIOBase):
+    """sys.stdout stand-in that sends each worker thread's prints to its own buffer."""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def write(self, s):
+        return getattr(self._local, "buffer", self._fallback).write(s)
+
+    def flush(self):
+        self._fallback.flush()
+
+    def capture(self, name, test_func):
+        """Run test_func with its output buffered; returns (passed, output)."""
+        self._local.buffer = io.StringIO()
+        try:
+            result = test_func()
+        except Exception as e:
+            print(f"  ❌ Test '{name}' failed: {e}")
+            result = False
+        finally:
+            output = self._local.buffer.getvalue()
+            del self._local.buffer
+        return result, output
+
+async def _run_tests(tests):
+    """Run the checks side by side and replay their output in declaration order."""
+    stdout = sys.stdout
+    sys.stdout = proxy = _PerThreadStdout(stdout)
+    try:
+        outcomes = await asyncio.gather(
+            *(asyncio.to_thread(proxy.capture, name, test_func) for name, test_func in tests)
+        )
+    finally:
+        sys.stdout = stdout
+    results = []
+    for (name, _), (passed, output) in zip(tests, outcomes):
+        stdout.write(output)
+        results.append((name, passed))
+    return results
+
 def main():
     """Run all validation tests."""
     print("🌌 Dream-Mind-Lucid Installation Validation")
@@ -147,15 +192,8 @@ def main():
         ("Project Structure", test_project_structure)
     ]
     
-    results = []
-    
-    for name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((name, result))
-        except Exception as e:
-            print(f"  ❌ Test '{name}' failed: {e}")
-            results.append((name, False))
+    # Each check waits on imports, npm or cargo, so run them concurrently
+    results = asyncio.run(_run_tests(tests))
     
     print("\n" + "=" * 50)
     print("📊 VALIDATION SUMMARY:")